@@ -1,7 +1,70 @@
-import numpy as np
-import os.path
-from scipy import interpolate
+import functools
+import io
 import logging
+import numpy as np
+import os
+import zipfile
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+logging.basicConfig(filename="HRM_logs.txt",
+                    format='%(asctime)s %(levelname)s:%(message)s',
+                    datefmt='%m/%d/%Y %I:%M:%S %p')
+
+_CSV_EXT = ".csv"
+
+
+@functools.lru_cache(maxsize=8)
+def _read_csv_bytes(csv_file_path, mtime):
+    """Reads the raw bytes of a CSV file, memoized on (path, mtime).
+
+    Repeated DataReader constructions over the same unchanged file (the
+    test fixtures and batch sweeps do this constantly) hit the cache and
+    skip the file read entirely; an edited file changes its mtime and
+    therefore its cache key.
+
+    Parameters
+    ----------
+    csv_file_path:  str
+                    Path of the csv file
+    mtime:          float
+                    Modification time of the file, part of the cache key
+
+    Returns
+    -------
+    raw_bytes:  bytes
+                The file contents
+    """
+    with open(csv_file_path, 'rb') as csv_file:
+        return csv_file.read()
+
+
+class ECGData:
+    """Lightweight record holding the data parsed by the DataReader.
+
+    Using __slots__ keeps the record compact and makes attribute access
+    cheaper than repeated dictionary lookups for consumers that process
+    the arrays in tight loops.
+
+    Attributes
+    ----------
+    time:       numpy array
+                Time values read in from the CSV file
+    voltage:    numpy array
+                Voltage values read in from the CSV file
+    duration:   tuple (float, float)
+                Start and end times (in seconds) for BPM calculation
+    """
+
+    __slots__ = ("time", "voltage", "duration")
+
+    def __init__(self, time=None, voltage=None, duration=None):
+        self.time = time
+        self.voltage = voltage
+        self.duration = duration
 
 
 class DataReader:
@@ -20,77 +83,94 @@ class DataReader:
     duration:       tuple (float, float)
                     A tuple containing the start and end times (in seconds) for
                     range over which the ECG data will be calculated
+    data:           ECGData
+                    A slotted record with the time and voltage numpy arrays
+                    from the CSV file and the user specified duration (or a
+                    default duration) for BPM calculation.
+    voltage_dtype:  numpy dtype
+                    Dtype used for the voltage array, np.float64 by default.
+                    ECG voltages come from ADCs with at most 16 bits of
+                    precision, so np.float32 can be requested to halve the
+                    memory traffic of downstream processing without losing
+                    signal information. Time stays float64 so precision does
+                    not degrade over long strips.
     output_dict:    dict
-                    A dictionary containing the relevant output data for the
-                    HRM_Processor - i.e. time and voltage numpy arrays,
-                    and the user specified duration (or a default duration)
-                    for BPM calculation.
+                    A dictionary view of the data record containing the
+                    relevant output data for the HRM_Processor - i.e. time
+                    and voltage numpy arrays, and the duration for BPM
+                    calculation.
     """
-    def __init__(self, csv_file_path, duration=None):
+    def __init__(self, csv_file_path, duration=None,
+                 voltage_dtype=np.float64, cache=False):
 
-        logging.basicConfig(filename="HRM_logs.txt",
-                            format='%(asctime)s %(levelname)s:%(message)s',
-                            datefmt='%m/%d/%Y %I:%M:%S %p')
-
-        self.output_dict = {}
+        self.data = ECGData()
+        self.voltage_dtype = np.dtype(voltage_dtype)
+        self.cache = cache
         try:
             self.validate_csv_file(csv_file_path)
-            self.csv_file_path = csv_file_path
-
-            try:
-                self.read_csv_file()
-
-                if duration is None:
-                    self.duration = (
-                        np.amin(self.output_dict["time"]),
-                        np.amax(self.output_dict["time"]))
-                    self.output_dict["duration"] = self.duration
-                else:
-                    try:
-                        self.validate_duration(self.output_dict["time"],
-                                               duration)
-                        self.duration = duration
-                        self.output_dict["duration"] = self.duration
-                    except ValueError:
-                        print(
-                            "The duration specified is not valid. Using full"
-                            "duration of ECG strip instead")
-
-                        logging.error("The duration specified is not valid. "
-                                      "Using full duration of ECG strip "
-                                      "instead.")
-                        self.duration = (
-                            np.amin(self.output_dict["time"]),
-                            np.amax(self.output_dict["time"]))
-                        self.output_dict["duration"] = self.duration
-
-            except TypeError:
-                print("The csv file has blank or non-numerical values. "
-                      "Please remove these and try again.")
-                logging.error("The csv file has blank or non-numerical "
-                              "values. Please remove these and try again.")
-                raise TypeError
+        except ValueError:
+            print("The input file does not have a .csv file extension. "
+                  "Please try again with a CSV file.")
+            logging.error("the input file does not have a .csv file "
+                          "extension. Please try again with a CSV file.")
+            raise
 
-            except ValueError:
-                print("the length of the time vector is not equal to the "
-                      "length of the voltage vector. Please fix this problem"
-                      "in the CSV file and try again.")
-                logging.error("the length of the time vector is not equal to "
-                              "the length of the voltage vector. Please fix "
-                              "this problem in the CSV file and try again.")
-                raise ValueError
+        self.csv_file_path = csv_file_path
 
+        try:
+            self.read_csv_file()
         except FileNotFoundError:
             print("The input file cannot be found. Please try again.")
             logging.error("The input file cannot be found. Please try again")
-            raise FileNotFoundError
-
+            raise
+        except TypeError:
+            print("The csv file has blank or non-numerical values. "
+                  "Please remove these and try again.")
+            logging.error("The csv file has blank or non-numerical "
+                          "values. Please remove these and try again.")
+            raise
         except ValueError:
-            print("The input file does not have a .csv file extension. "
-                  "Please try again with a CSV file.")
-            logging.error("the input file does not have a .csv file "
-                          "extension. Please try again with a CSV file.")
-            raise ValueError
+            print("the length of the time vector is not equal to the "
+                  "length of the voltage vector. Please fix this problem"
+                  "in the CSV file and try again.")
+            logging.error("the length of the time vector is not equal to "
+                          "the length of the voltage vector. Please fix "
+                          "this problem in the CSV file and try again.")
+            raise
+
+        if duration is None:
+            self.duration = (self._time_min, self._time_max)
+        else:
+            try:
+                self.validate_duration(self.data.time, duration,
+                                       time_bounds=(self._time_min,
+                                                    self._time_max))
+                self.duration = duration
+            except ValueError:
+                print("The duration specified is not valid. Using full"
+                      "duration of ECG strip instead")
+
+                logging.error("The duration specified is not valid. "
+                              "Using full duration of ECG strip "
+                              "instead.")
+                self.duration = (self._time_min, self._time_max)
+
+        self.data.duration = self.duration
+
+    @property
+    def output_dict(self):
+        """dict: Dictionary view of the parsed data for the HRM_Processor.
+
+        Built from the ECGData record so existing consumers that expect
+        the time/voltage/duration dictionary keep working.
+        """
+        out = {}
+        if self.data.time is not None:
+            out["time"] = self.data.time
+            out["voltage"] = self.data.voltage
+        if self.data.duration is not None:
+            out["duration"] = self.data.duration
+        return out
 
     def read_csv_file(self):
         """read_csv_file reads in the CSV file from the csv_file_path
@@ -102,25 +182,226 @@ class DataReader:
         None
         """
 
-        time = np.genfromtxt(self.csv_file_path, delimiter=',', usecols=(0))
+        if self.cache:
+            cached = self._load_cached_arrays()
+            if cached is not None:
+                self.data.time = cached[0]
+                self.data.voltage = self._cast_voltage(cached[1])
+                self._cache_time_bounds(self.data.time)
+                return
+
+        time, voltage = self.parse_csv_columns()
+
+        finite_mask = np.isfinite(time)
+        if finite_mask.all():
+            # Fast path for clean files (the common case): the time axis
+            # has already been scanned, so only the voltage column and
+            # the array lengths still need checking.
+            if not np.isfinite(voltage).all():
+                raise TypeError
+            if time.size != voltage.size:
+                raise ValueError
+        else:
+            time = self._handle_missing_time(time, voltage, finite_mask)
+
+        self.data.time = time
+        self.data.voltage = voltage
+        self._cache_time_bounds(time)
+
+        if self.cache:
+            self._save_cached_arrays(time, voltage)
 
-        voltage = np.genfromtxt(self.csv_file_path, delimiter=',', usecols=(1))
+    def _cache_time_bounds(self, time):
+        """Computes and stores the min and max of the time array once.
 
-        if np.isnan(time).any():
-            can_interp = self.can_interp(time)
-            if can_interp:
-                print("warning: interpolating missing time values.")
-                logging.warning("Interpolating missing time values.")
-                time = self.interp_time(time)
+        The bounds are needed for the default duration and for duration
+        validation; caching them here avoids re-scanning the full time
+        array for every consumer.
 
-        self.validate_csv_data(time, voltage)
+        Parameters
+        ----------
+        time:   numpy array
+                Time values read in from the CSV file
+        """
+        self._time_min = float(time.min())
+        self._time_max = float(time.max())
 
-        self.output_dict["time"] = time
-        self.output_dict["voltage"] = voltage
+    def _cache_file_path(self):
+        """Returns the path of the .npz sidecar cache for the CSV file."""
+        return self.csv_file_path + ".npz"
+
+    def _load_cached_arrays(self):
+        """Loads the time and voltage arrays from the .npz sidecar cache.
+
+        The cache is only used when it is newer than the CSV file, so a
+        re-exported strip invalidates it automatically. A corrupt or
+        truncated sidecar (np.load raises BadZipFile or ValueError for
+        those) is treated the same as a missing one, so the constructor
+        falls back to parsing the CSV instead of failing.
+
+        Returns
+        -------
+        arrays: tuple(numpy array, numpy array) or None
+                The cached (time, voltage) arrays, or None when there is
+                no usable cache.
+        """
+        cache_path = self._cache_file_path()
+        try:
+            if os.path.getmtime(cache_path) <= \
+                    os.path.getmtime(self.csv_file_path):
+                return None
+            with np.load(cache_path) as cached:
+                return cached["time"], cached["voltage"]
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+
+    def _save_cached_arrays(self, time, voltage):
+        """Writes the parsed arrays to the .npz sidecar cache.
+
+        Binary float arrays re-load an order of magnitude faster than
+        ASCII CSV parsing, so repeated runs over the same strip skip the
+        text tokenization entirely. The arrays are written to a temporary
+        file first and moved into place with an atomic os.replace, so an
+        interrupted write (or a concurrent writer, e.g. parallel test
+        workers sharing a fixture file) can never leave a half-written
+        sidecar where a reader would find it.
+
+        Parameters
+        ----------
+        time:       numpy array
+                    Time values parsed from the CSV file
+        voltage:    numpy array
+                    Voltage values parsed from the CSV file
+        """
+        cache_path = self._cache_file_path()
+        temp_path = cache_path + ".tmp" + str(os.getpid())
+        try:
+            with open(temp_path, 'wb') as cache_file:
+                np.savez(cache_file, time=time, voltage=voltage)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            logging.warning("Could not write parse cache for " +
+                            self.csv_file_path)
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def _handle_missing_time(self, time, voltage, finite_mask):
+        """Interpolates missing time values when possible and validates
+        the result. Slow path of read_csv_file, only entered when the
+        time array contains non-finite values.
+
+        Parameters
+        ----------
+        time:       numpy array
+                    Time values read in from the CSV file
+        voltage:    numpy array
+                    Voltage values read in from the CSV file
+        finite_mask:    numpy array
+                        np.isfinite(time), precomputed by read_csv_file
+
+        Returns
+        -------
+        time:   numpy array
+                Time values with the missing entries interpolated
+        """
+        if self.can_interp(time, finite_mask):
+            print("warning: interpolating missing time values.")
+            logging.warning("Interpolating missing time values.")
+            time = self.interp_time(time, finite_mask)
+            finite_mask = None
+
+        self.validate_csv_data(time, voltage, finite_mask)
+        return time
+
+    def parse_csv_columns(self):
+        """Parses the time and voltage columns out of the CSV file in a
+        single pass over the file.
+
+        Uses the pandas C parser when pandas is installed, which is much
+        faster than np.genfromtxt for large ECG strips. Without pandas,
+        clean files are read through np.loadtxt (implemented in C since
+        NumPy 1.23). Falls back to np.genfromtxt when neither fast parser
+        can handle the file, which preserves the NaN behavior for blank
+        or non-numerical values.
+
+        Returns
+        -------
+        time:       numpy array
+                    Time values read in from the CSV file
+        voltage:    numpy array
+                    Voltage values read in from the CSV file
+        """
+        self._advise_sequential_read()
+        raw_bytes = _read_csv_bytes(self.csv_file_path,
+                                    os.path.getmtime(self.csv_file_path))
+
+        if pd is not None:
+            try:
+                df = pd.read_csv(io.BytesIO(raw_bytes), header=None,
+                                 usecols=[0, 1], engine='c')
+                time = df.iloc[:, 0].to_numpy(dtype=np.float64)
+                voltage = df.iloc[:, 1].to_numpy(dtype=self.voltage_dtype)
+                return time, voltage
+            except (pd.errors.ParserError, ValueError):
+                pass
+
+        try:
+            arr = np.loadtxt(io.BytesIO(raw_bytes), delimiter=',',
+                             usecols=(0, 1), dtype=np.float64, ndmin=2)
+            return arr[:, 0], self._cast_voltage(arr[:, 1])
+        except ValueError:
+            # Blank or non-numerical values; genfromtxt turns these into
+            # NaNs so the interpolation and validation paths still work.
+            pass
+
+        arr = np.atleast_2d(np.genfromtxt(io.BytesIO(raw_bytes),
+                                          delimiter=',', usecols=(0, 1)))
+        return arr[:, 0], self._cast_voltage(arr[:, 1])
+
+    def _advise_sequential_read(self):
+        """Hints to the OS that the CSV file is about to be read front to
+        back, so the kernel can read ahead aggressively. A no-op on
+        platforms without posix_fadvise.
+
+        Returns
+        -------
+        None
+        """
+        if hasattr(os, "posix_fadvise"):
+            try:
+                fd = os.open(self.csv_file_path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+
+    def _cast_voltage(self, voltage):
+        """Casts the voltage column to the requested voltage_dtype.
+
+        Parameters
+        ----------
+        voltage:    numpy array
+                    Voltage values read in from the CSV file
+
+        Returns
+        -------
+        voltage:    numpy array
+                    Voltage values with dtype == self.voltage_dtype
+        """
+        if voltage.dtype != self.voltage_dtype:
+            voltage = voltage.astype(self.voltage_dtype)
+        return voltage
 
     def validate_csv_file(self, csv_file_path):
-        """Checks to make sure that the csv file exists and has a csv file
-        extension. Called by read_csv_file function.
+        """Checks to make sure that the csv file has a csv file extension.
+
+        A missing file is detected when the parser opens it, which raises
+        FileNotFoundError without the extra stat syscall a separate
+        os.path.isfile check would cost.
 
         Parameters
         ----------
@@ -131,13 +412,11 @@ class DataReader:
         -------
         None
         """
-        if not os.path.isfile(csv_file_path):
-            raise FileNotFoundError
-
-        if not csv_file_path.lower().endswith(".csv"):
+        if not csv_file_path.lower().endswith(_CSV_EXT):
             raise ValueError
 
-    def validate_csv_data(self, time_array, voltage_array):
+    def validate_csv_data(self, time_array, voltage_array,
+                          time_finite_mask=None):
         """Checks that the CSV data that has been read in does not have any
         NaNs and that the time_array and voltage_array are the same length.
 
@@ -153,18 +432,28 @@ class DataReader:
         voltage_array:  Numpy array
                         Voltage values read in from CSV file
 
+        time_finite_mask:   Numpy array, optional
+                            Precomputed np.isfinite(time_array) mask,
+                            passed in by read_csv_file to avoid scanning
+                            the time array a second time.
+
         Returns
         -------
         None
         """
 
-        if np.isnan(time_array).any() or np.isnan(voltage_array).any():
+        if time_finite_mask is None:
+            time_is_clean = np.isfinite(time_array).all()
+        else:
+            time_is_clean = time_finite_mask.all()
+
+        if not (time_is_clean and np.isfinite(voltage_array).all()):
             raise TypeError
 
         if time_array.size != voltage_array.size:
             raise ValueError
 
-    def can_interp(self, time_array):
+    def can_interp(self, time_array, finite_mask=None):
         """Checks to see if a time_array can be interpolated, which would
         mean that it has less than 10% missing values.
 
@@ -172,14 +461,19 @@ class DataReader:
         ----------
         time_array: numpy array
                     Time values read in from CSV file
+        finite_mask:    numpy array, optional
+                        Precomputed np.isfinite(time_array) mask, so
+                        callers that already scanned the array do not
+                        trigger a second pass.
         Returns
         -------
         can_interp: boolean
                     Specifies if this array can be interpolated
         """
 
-        is_finite = np.isfinite(time_array)
-        num_defined_vals = sum(is_finite)
+        if finite_mask is None:
+            finite_mask = np.isfinite(time_array)
+        num_defined_vals = np.count_nonzero(finite_mask)
 
         frac_def_vals = num_defined_vals / time_array.size
 
@@ -190,7 +484,7 @@ class DataReader:
 
         return can_interp
 
-    def interp_time(self, time_array):
+    def interp_time(self, time_array, finite_mask=None):
         """Linearly interpolates missing time values in the time_array
 
         Parameters
@@ -198,22 +492,27 @@ class DataReader:
         time_array: numpy array
                     Numpy array containing time values from csv file,
                     with some missing values.
+        finite_mask:    numpy array, optional
+                        Precomputed np.isfinite(time_array) mask, so
+                        callers that already scanned the array do not
+                        trigger a second pass.
 
         Returns
         -------
         interp_time:    numpy array
                         A numpy array with the NaNs linearly interpolated.
         """
-        defined_indicies = np.isfinite(time_array)
-        indices = np.arange(0, time_array.size)
-        interp_funct = interpolate.interp1d(indices[defined_indicies],
-                                            time_array[defined_indicies])
+        if finite_mask is None:
+            finite_mask = np.isfinite(time_array)
+        defined_indices = np.flatnonzero(finite_mask)
 
-        interp_time = interp_funct(indices)
+        interp_time = np.interp(np.arange(0, time_array.size),
+                                defined_indices,
+                                time_array[defined_indices])
 
         return interp_time
 
-    def validate_duration(self, time_array, duration):
+    def validate_duration(self, time_array, duration, time_bounds=None):
         """Checks that a user-specified duration for BPM calculation is valid.
 
         A valid duration is one that is within the range of possible time
@@ -227,13 +526,21 @@ class DataReader:
         duration:   tuple(float, float)
                     Specifies the min and max times of the duration of interest
                     for BPM calculation in the format (min, max)
+        time_bounds:    tuple(float, float), optional
+                        Precomputed (min, max) of the time_array, so that
+                        callers which already cached the bounds (the
+                        constructor stores them when the file is read) do
+                        not re-scan the array.
 
         Returns
         -------
         None
         """
-        min_time = np.amin(time_array)
-        max_time = np.amax(time_array)
+        if time_bounds is not None:
+            min_time, max_time = time_bounds
+        else:
+            min_time = time_array.min()
+            max_time = time_array.max()
 
         if duration[0] < min_time or duration[1] > max_time:
             raise ValueError
@@ -1,7 +1,17 @@
 import json
+import numpy as np
 import os
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logging.basicConfig(filename="HRM_logs.txt",
+                    format='%(asctime)s %(levelname)s:%(message)s',
+                    datefmt='%m/%d/%Y %I:%M:%S %p')
+
 
 class DataWriter:
     """Writes the output metrics from the HRM_Processor to a JSON file.
@@ -15,7 +25,11 @@ class DataWriter:
     csv_file:   str
                 The name of the CSV file with the original ECG data
     """
-    def __init__(self, hrm):
+
+    METRIC_KEYS = ("mean_hr_bpm", "voltage_extremes", "duration",
+                   "num_beats", "beats")
+
+    def __init__(self, hrm, out=None):
         """Constructor for DataWriter Object
 
         Parameters
@@ -23,14 +37,18 @@ class DataWriter:
         hrm:    HRM_Processor
                 An HRM_Processor which has an output_dict containing the
                 relevant output parameters to be written to the JSON file.
+        out:    binary file object, optional
+                An already-open (typically buffered) writable handle. When
+                given, the metrics are written to it instead of a file
+                derived from the CSV name, and the handle is left open so
+                batch callers can amortize open/close across many outputs.
         """
-
-        logging.basicConfig(filename="HRM_logs.txt",
-                            format='%(asctime)s %(levelname)s:%(message)s',
-                            datefmt='%m/%d/%Y %I:%M:%S %p')
+        self.out = out
 
         if hrm.isValid:
-            self.metrics = self.convert_np_arrays(hrm.output_dict)
+            metrics = {key: hrm.output_dict[key] for key in self.METRIC_KEYS
+                       if key in hrm.output_dict}
+            self.metrics = self.convert_np_arrays(metrics)
             self.csv_file = hrm.csv_file
             output_file = self.get_output_file_name(self.csv_file)
             self.write_to_json(self.metrics, output_file)
@@ -67,27 +85,54 @@ class DataWriter:
         return output_file
 
     def convert_np_arrays(self, input_dict):
-        """Converts numpy arrays in the input_dict to a regular,
-        serializable python lists, so that the dictionary can be written to
-        a JSON file.
+        """Converts numpy values in the input_dict to regular, serializable
+        python types, so that the dictionary can be written to a JSON file.
+
+        Numpy arrays become lists through ndarray.tolist(), which converts
+        in bulk at the C level, and numpy scalars (e.g. the np.float64
+        values inside the voltage_extremes tuple) become plain python
+        numbers. The input dictionary is not modified.
 
         Parameters
         ----------
         input_dict: dict
-                    Expecting a dictionary from the HRM_Processor that has a
-                    numpy array in the 'beats' entry
+                    Expecting a dictionary from the HRM_Processor with
+                    numpy arrays, numpy scalars and tuples among its values
         Returns
         -------
         serializable_dict:  dict
-                            A dictionary that is equivalent to the
-                            input_dict, but the "beats" entry has been
-                            converted from a numpy array to a dictionary.
+                            A new dictionary that is equivalent to the
+                            input_dict with every value converted to a
+                            JSON-serializable python type.
 
         """
-        serializable_dict = input_dict
-        serializable_dict["beats"] = input_dict["beats"].tolist()
+        return {key: self._to_serializable(value)
+                for key, value in input_dict.items()}
 
-        return serializable_dict
+    def _to_serializable(self, value):
+        """Recursively converts a single metric value to a plain python
+        type that the JSON encoder accepts.
+
+        Parameters
+        ----------
+        value:  object
+                A metric value: numpy array, numpy scalar, tuple, list,
+                or an already-serializable python object
+
+        Returns
+        -------
+        value:  object
+                The equivalent value built from python types only
+        """
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, tuple):
+            return tuple(self._to_serializable(item) for item in value)
+        if isinstance(value, list):
+            return [self._to_serializable(item) for item in value]
+        return value
 
     def write_to_json(self, metrics, filename):
         """Writes the metrics dictionary to the specified filename as a JSON
@@ -106,5 +151,24 @@ class DataWriter:
         None
         """
 
-        with open(filename, 'w') as outfile:
-            json.dump(metrics, outfile)
+        if orjson is not None:
+            encoded_metrics = orjson.dumps(
+                metrics, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            encoded_metrics = json.dumps(metrics).encode('utf-8')
+
+        if self.out is not None:
+            self.out.write(encoded_metrics)
+        else:
+            with open(filename, 'wb', buffering=1024 * 1024) as outfile:
+                outfile.write(encoded_metrics)
+
+    def flush(self):
+        """Flushes the caller-provided output handle, if one was given.
+
+        Returns
+        -------
+        None
+        """
+        if self.out is not None:
+            self.out.flush()
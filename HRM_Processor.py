@@ -1,6 +1,10 @@
 import numpy as np
 import logging
 
+logging.basicConfig(filename="HRM_logs.txt",
+                    format='%(asctime)s %(levelname)s:%(message)s',
+                    datefmt='%m/%d/%Y %I:%M:%S %p')
+
 
 class HRM_Processor:
     """The HRM_Processer takes in time, voltage, and BPM duration from the
@@ -20,6 +24,10 @@ class HRM_Processor:
                 True if the number of beats is realistic for the ECG
                 strip duration. Used by the DataWriter to determine if
                 the data should be written to the JSON file.
+    _voltage_max:   float
+                    Maximum of the voltage array, cached when the voltage
+                    extremes are computed so later pipeline steps do not
+                    re-scan the array.
 
     """
     def __init__(self, DataReader):
@@ -33,10 +41,6 @@ class HRM_Processor:
                     for the HRM_Processor
         """
 
-        logging.basicConfig(filename="HRM_logs.txt",
-                            format='%(asctime)s %(levelname)s:%(message)s',
-                            datefmt='%m/%d/%Y %I:%M:%S %p')
-
         self.csv_file = DataReader.csv_file_path
         self.input_data = DataReader.output_dict
         self.output_dict = {}
@@ -60,16 +64,28 @@ class HRM_Processor:
         None
 
         """
-        voltage_extremes = self.determine_voltage_extremes(self.input_data[
-                                                          "voltage"])
+        time = self.input_data["time"]
+        voltage = self.input_data["voltage"]
+
+        voltage_extremes = self.determine_voltage_extremes(voltage)
         self.output_dict["voltage_extremes"] = voltage_extremes
+        self._voltage_max = voltage_extremes[1]
 
-        ecg_strip_duration = self.determine_ecg_strip_duration(self.input_data[
-                                                                   "time"])
+        ecg_strip_duration = self.determine_ecg_strip_duration(time)
         self.output_dict["duration"] = ecg_strip_duration
 
+        # ECG voltages carry at most 16 bits of ADC precision, so beat
+        # detection can run on a float32 copy at half the memory traffic.
+        # The reported voltage extremes above keep the source precision.
+        if voltage.dtype == np.float64:
+            detection_voltage = voltage.astype(np.float32)
+        else:
+            detection_voltage = voltage
+
         beat_start_times = self.determine_beat_start_times(
-            self.input_data["time"], self.input_data["voltage"])
+            time, detection_voltage,
+            voltage_max=float(self._voltage_max),
+            voltage_min=float(voltage_extremes[0]))
         self.output_dict["beats"] = beat_start_times
 
         num_beats = self.determine_num_beats(beat_start_times)
@@ -122,8 +138,8 @@ class HRM_Processor:
                             voltage data in the format (min, max)
 
         """
-        voltage_min = np.amin(voltage)
-        voltage_max = np.amax(voltage)
+        voltage_min = voltage.min()
+        voltage_max = voltage.max()
 
         voltage_extremes = (voltage_min, voltage_max)
 
@@ -144,7 +160,7 @@ class HRM_Processor:
         None
 
         """
-        if abs(voltage_extremes[0]) > 300 or abs(voltage_extremes[1] > 300):
+        if max(abs(voltage_extremes[0]), abs(voltage_extremes[1])) > 300:
             print("Warning: voltage values exceed expected levels for a "
                   "typical ECG signal. This data may not be valid.")
             logging.warning("The voltage values exceed expected values for a"
@@ -163,20 +179,21 @@ class HRM_Processor:
         strip_duration: float
                         The max time value of the ecg strip = strip duration
         """
-        strip_duration = np.amax(time)
+        strip_duration = time.max()
         return strip_duration
 
-    def determine_beat_start_times(self, time, voltage):
+    def determine_beat_start_times(self, time, voltage, voltage_max=None,
+                                   voltage_min=None):
         """Create a numpy array with the starting time for each beat.
 
         The starting time of a beat is defined as the peak of the QRS
-        complex. This function essentially synthesizes the outputs of helper
-        functions to implement a thresholding beat detection algorithm. This
-        algorithm essentially identifies continuous regions where the voltage
-        trace is continuously above the threshold (which should correspond to
-        the QRS complex of a beat), finds maximum of the voltage trace within
-        each continuous region, and then indexes the corresponding time value
-        in the time array to determine the start time of each beat.
+        complex. This function implements a thresholding beat detection
+        algorithm in a single vectorized sweep: it builds a boolean mask of
+        the samples above the threshold, finds the rising and falling edges
+        of that mask (which bound the QRS complex of each beat), locates
+        the maximum of the voltage trace within each above-threshold
+        region, and then indexes the corresponding time value in the time
+        array to determine the start time of each beat.
 
         Parameters
         ----------
@@ -184,6 +201,15 @@ class HRM_Processor:
                     Time values read in from CSV file
         voltage:    Numpy array
                     Voltages read in from CSV file
+        voltage_max:    float, optional
+                        Precomputed maximum of the voltage array, so that
+                        callers which already know it (write_outputs_to_dict
+                        computes the voltage extremes first) do not trigger
+                        another full scan.
+        voltage_min:    float, optional
+                        Precomputed minimum of the voltage array, used
+                        together with voltage_max to detect a constant
+                        signal without re-scanning the array.
 
         Returns
         -------
@@ -191,15 +217,37 @@ class HRM_Processor:
                         Start times of each beat (defined as the time of the
                         peak of each QRS complex)
         """
-        threshold = self.determine_threshold(voltage)
-        inx_above_threshold = self.find_indices_above_threshold(voltage,
-                                                                threshold)
-        beat_sep_points = self.find_beat_separation_points(inx_above_threshold)
-        qrs_peak_inx = self.find_beat_separation_points(beat_sep_points)
+        if voltage.size == 0:
+            logging.warning("Voltage signal is empty; no beats can be "
+                            "detected.")
+            return np.empty(0, dtype=np.float64)
+
+        if voltage_min is None:
+            voltage_min = voltage.min()
+        if voltage_max is None:
+            voltage_max = voltage.max()
+        if voltage_min == voltage_max:
+            logging.warning("Voltage signal is constant (e.g. leads off); "
+                            "no beats can be detected.")
+            return np.empty(0, dtype=np.float64)
+
+        threshold = self.determine_threshold(voltage, voltage_max)
+        above_threshold = voltage > threshold
+        edges = np.diff(above_threshold.astype(np.int8),
+                        prepend=np.int8(0), append=np.int8(0))
+        qrs_starts = np.flatnonzero(edges == 1)
+        qrs_ends = np.flatnonzero(edges == -1)
+
+        qrs_peak_inx = np.empty(qrs_starts.size, dtype=np.intp)
+        for i in range(qrs_starts.size):
+            start = qrs_starts[i]
+            segment = voltage[start:qrs_ends[i]]
+            qrs_peak_inx[i] = start + int(np.argmax(segment))
+
         start_times = self.index_beat_start_times(time, qrs_peak_inx)
         return start_times
 
-    def determine_threshold(self, voltage):
+    def determine_threshold(self, voltage, voltage_max=None):
         """Determines the threshold voltage for defining the start and end
         of the QRS complex.
 
@@ -209,6 +257,9 @@ class HRM_Processor:
         ----------
         voltage:    Numpy array
                     The voltage values from the CSV file
+        voltage_max:    float, optional
+                        Precomputed maximum of the voltage array; when
+                        given, the array is not scanned again.
 
         Returns
         -------
@@ -216,7 +267,9 @@ class HRM_Processor:
                     The 'threshold' for the QRS complex, which occurs when
                     the voltage value is above 75% of its original value.
         """
-        threshold = 0.75*np.amax(voltage)
+        if voltage_max is None:
+            voltage_max = voltage.max()
+        threshold = 0.75*voltage_max
 
         return threshold
 
@@ -238,7 +291,7 @@ class HRM_Processor:
                     The indices for which the voltage data exceeds the
                     threshold value.
         """
-        indices = np.argwhere(voltage > threshold).flatten()
+        indices = np.flatnonzero(voltage > threshold)
         return indices
 
     def find_beat_separation_points(self, indices_array):
@@ -272,8 +325,8 @@ class HRM_Processor:
                         beat (i.e. the beat separations)
         """
 
-        diff_array = np.diff(indices_array)
-        beat_seps = np.argwhere(diff_array > 2).flatten()
+        beat_seps = np.flatnonzero(
+            indices_array[1:] - indices_array[:-1] > 2)
         beat_sep_inx = indices_array[beat_seps]
         return beat_sep_inx
 
@@ -297,18 +350,14 @@ class HRM_Processor:
                             The locations of the peak of the QRS complex for
                             each beat
         """
+        qrs_peak_locations = np.empty(beat_sep_inx.size + 1, dtype=np.intp)
         start_inx = 0
-        qrs_peak_locations = np.array([])
-        for beat_sep in beat_sep_inx:
+        for i, beat_sep in enumerate(beat_sep_inx):
             temp = voltage[start_inx:beat_sep+1]
-            qrs_max_loc = start_inx + np.asscalar(np.where(temp == np.amax(
-                temp))[0])
-            qrs_peak_locations = np.append(qrs_peak_locations, qrs_max_loc)
+            qrs_peak_locations[i] = start_inx + int(np.argmax(temp))
             start_inx = beat_sep
-        temp = voltage[beat_sep+1:np.alen(voltage)]
-        qrs_max_loc = start_inx + np.asscalar(np.where(temp == np.amax(
-            temp))[0])
-        qrs_peak_locations = np.append(qrs_peak_locations, qrs_max_loc)
+        temp = voltage[start_inx+1:]
+        qrs_peak_locations[-1] = start_inx + int(np.argmax(temp))
 
         return qrs_peak_locations
 
@@ -332,7 +381,8 @@ class HRM_Processor:
                             as the time of the peak of the QRS complex)
         """
 
-        beat_start_times = time[qrs_peak_locations].flatten()
+        beat_start_times = time[
+            qrs_peak_locations.astype(np.intp, copy=False)]
         return beat_start_times
 
     def determine_num_beats(self, beat_start_times):
@@ -350,7 +400,7 @@ class HRM_Processor:
         num_beats:          int
                             The number of beats
         """
-        num_beats = np.size(beat_start_times)
+        num_beats = beat_start_times.shape[0]
         return num_beats
 
     def is_unrealistic_num_beats(self, num_beats, duration):
@@ -408,11 +458,8 @@ class HRM_Processor:
             logging.warning("No beats detected for BPM calculation")
             mean_hr_bpm = 0
         else:
-            start_inx = np.argmax(beat_start_times >= duration[0])
-            end_inx = np.argmax(beat_start_times >= duration[1])
-
-            if beat_start_times[-1] < duration[1]:
-                end_inx = beat_start_times.size - 1
+            start_inx, end_inx = np.searchsorted(beat_start_times, duration,
+                                                 side='left')
 
             num_beats_in_duration = end_inx - start_inx
             time_in_seconds = duration[1] - duration[0]
@@ -1,26 +1,71 @@
 import os
 import logging
+import multiprocessing
+from contextlib import contextmanager
 from DataReader import DataReader
 from DataWriter import DataWriter
 from HRM_Processor import HRM_Processor
 
-os.chdir("test_data")
+TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "test_data")
 
-for i in range(1, 33):
-    base_file_name = "test_data" + str(i)
+LOG_FORMATTER = logging.Formatter('%(asctime)s %(levelname)s:%(message)s',
+                                  '%m/%d/%Y %I:%M:%S %p')
+
+
+@contextmanager
+def per_file_logging(base_file_name):
+    """Attaches a FileHandler named after the test file to the root logger
+    for the duration of the block, then detaches and closes it.
+
+    Parameters
+    ----------
+    base_file_name: str
+                    The test file path without its .csv extension
+
+    Returns
+    -------
+    None
+    """
+    file_handler = logging.FileHandler(base_file_name + "_logs.txt")
+    file_handler.setFormatter(LOG_FORMATTER)
+    logging.root.addHandler(file_handler)
+    try:
+        yield
+    finally:
+        logging.root.removeHandler(file_handler)
+        file_handler.close()
+
+
+def process(i):
+    """Runs the full DataReader -> HRM_Processor -> DataWriter pipeline on
+    the numbered test file, logging to a file named after the test file.
+
+    Parameters
+    ----------
+    i:      int
+            The number of the test_data CSV file to process
+
+    Returns
+    -------
+    None
+    """
+    base_file_name = os.path.join(TEST_DATA_DIR, "test_data" + str(i))
     file_name = base_file_name + ".csv"
     print(file_name)
 
-    logging.basicConfig(filename=base_file_name + "_logs.txt",
-                        format='%(asctime)s %(levelname)s:%(message)s',
-                        datefmt='%m/%d/%Y %I:%M:%S %p')
-    try:
-        dr = DataReader(file_name)
-        hrm = HRM_Processor(dr)
-        dw = DataWriter(hrm)
-    except(FileNotFoundError, ValueError, TypeError):
-        logging.info("Attempt to make process file was terminated.")
-    # Remove all handlers associated with the root logger object.
-    # this allows for the creation of a new log file for each test file
-    for handler in logging.root.handlers[:]:
-        logging.root.removeHandler(handler)
+    with per_file_logging(base_file_name):
+        try:
+            dr = DataReader(file_name)
+            hrm = HRM_Processor(dr)
+            dw = DataWriter(hrm)
+        except(FileNotFoundError, ValueError, TypeError):
+            logging.info("Attempt to make process file was terminated.")
+
+
+if __name__ == "__main__":
+    # Each test file is independent, so the sweep can run one file per
+    # worker process. Workers configure their own logging, which keeps the
+    # per-file log files from contending across processes.
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        pool.map(process, range(1, 33))
@@ -1,3 +1,4 @@
+import shutil
 import pytest
 from DataReader import DataReader
 from HRM_Processor import HRM_Processor
@@ -8,15 +9,15 @@ the testing functions for the DataReader, HRM_Processor, and DataWriter.
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dr():
     """Create a basic DataReader object using test_file.csv
      """
-    dr = DataReader("test_file.csv")
+    dr = DataReader("test_file.csv", cache=True)
     return dr
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def hrm(dr):
     """Create a basic HRM_Processor from the dr object"""
 
@@ -24,10 +25,17 @@ def hrm(dr):
     return hrm
 
 
-@pytest.fixture
-def dw():
-    """Create a basic DataWriter object"""
-    dr_for_DW = DataReader('test_data1.csv')
+@pytest.fixture(scope="session")
+def dw(tmp_path_factory):
+    """Create a basic DataWriter object.
+
+    The CSV file is copied into a session temporary directory first, so
+    the JSON file the DataWriter constructor writes lands there instead
+    of in the project directory.
+    """
+    csv_copy = tmp_path_factory.mktemp("dw") / "test_data1.csv"
+    shutil.copyfile("test_data1.csv", csv_copy)
+    dr_for_DW = DataReader(str(csv_copy), cache=True)
     hrm_for_DW = HRM_Processor(dr_for_DW)
     dw = DataWriter(hrm_for_DW)
     return dw
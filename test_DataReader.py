@@ -3,7 +3,7 @@ import pytest
 import numpy as np
 
 
-def test_data_reader_default_duration():
+def test_data_reader_default_duration(dr):
     """Tests that data reader assigns a default value to the duration parameter
      if one is not assigned during construction. Default value should be min
      max values from the time array.
@@ -12,7 +12,6 @@ def test_data_reader_default_duration():
     -------
     None
     """
-    dr = DataReader("test_file.csv")
     assert dr.duration == (0, 2)
 
 
@@ -28,7 +27,7 @@ def test_data_reader_assigned_duration():
     assert dr.duration == (0, 2)
 
 
-def test_read_csv_time():
+def test_read_csv_time(dr):
     """Tests the read_csv function of the data reader for reading in the
     time numpy array from the csv file.
 
@@ -36,12 +35,11 @@ def test_read_csv_time():
     -------
     None
     """
-    dr = DataReader("test_file.csv")
     expected_time = np.array([0, 1, 2])
     assert np.array_equal(dr.output_dict["time"], expected_time)
 
 
-def test_read_csv_voltage():
+def test_read_csv_voltage(dr):
     """Tests the read_csv function of the data reader for reading in the
     voltage numpy array from the csv file.
 
@@ -49,36 +47,49 @@ def test_read_csv_voltage():
     -------
     None
     """
-    dr = DataReader("test_file.csv")
     expected_voltage = np.array([10, 15, 20])
     assert np.array_equal(dr.output_dict["voltage"], expected_voltage)
 
 
-def test_validate_csv_file_bad_file_name():
-    """Tests the validate_csv_file for raising an exception when a
-    file that
-    does not exist is inputted for the csv_file_name argument in DataReader.
+@pytest.mark.parametrize("file_name, expected_error", [
+    ("random_file_name.csv", FileNotFoundError),
+    ("BadExtensionTest.txt", ValueError),
+], ids=["missing_file", "bad_extension"])
+def test_validate_csv_file_bad_input(file_name, expected_error):
+    """Tests that constructing a DataReader raises the appropriate error
+    when the csv_file_name argument names a file that does not exist
+    (FileNotFoundError) or has a non-csv extension (ValueError).
+
+    Parameters
+    ----------
+    file_name:      str
+                    The bad file path passed into the DataReader
+    expected_error: Exception
+                    The error that the construction should raise
 
     Returns
     -------
     None
     """
-    with pytest.raises(FileNotFoundError):
-        dr = DataReader("random_file_name.csv")
-        dr.validate_csv_file("random_file_name.csv")
+    with pytest.raises(expected_error):
+        DataReader(file_name)
 
 
-def test_validate_csv_file_bad_file_extension():
-    """Tests the validate_csv_file function for raising a ValueError when
-    there is a bad file extension (i.e. one that is not .csv)
+def test_validate_csv_file_direct():
+    """Tests validate_csv_file itself, on an instance created without
+    running the constructor, so the assertion targets the extension check
+    rather than the construction-time parse. File existence is checked
+    when the parser opens the file, not by validate_csv_file, so only the
+    extension case raises here.
 
     Returns
     -------
     None
     """
+    dr = DataReader.__new__(DataReader)
     with pytest.raises(ValueError):
-        dr = DataReader("BadExtensionTest.txt")
         dr.validate_csv_file("BadExtensionTest.txt")
+    dr.validate_csv_file("random_file_name.csv")
 
 
 @pytest.mark.parametrize("duration_tuple", [
@@ -86,7 +97,7 @@ def test_validate_csv_file_bad_file_extension():
     (2, 5),  # max duration too long
     (0, 5),  # both min and max exceed range of time_array
 ])
-def test_validate_duration(duration_tuple):
+def test_validate_duration(dr, duration_tuple):
     """Tests the validate_duration function, which ensures that a user
     specified duration in the construction of the data reader object is
     within the range of time values read in from the CSV file.
@@ -95,7 +106,6 @@ def test_validate_duration(duration_tuple):
     -------
     None
     """
-    dr = DataReader("test_file.csv")
     time_array = np.array([1, 2, 3, 4])
 
     with pytest.raises(ValueError):
@@ -106,7 +116,7 @@ def test_validate_duration(duration_tuple):
     (np.array([1, 2, np.nan, 4.5]), np.array([1, 2, 3, 4.5])),
     (np.array([1, 2, 3, 4.5]), np.array([1, 2, np.nan, 4.5])),
 ])
-def test_validate_csv_data_check_nan(time_array, voltage_array):
+def test_validate_csv_data_check_nan(dr, time_array, voltage_array):
     """Checks that the validate csv data raises a TypeError when a nan is
     present in either the time_array or the voltage_array.
 
@@ -121,7 +131,6 @@ def test_validate_csv_data_check_nan(time_array, voltage_array):
     -------
     None
     """
-    dr = DataReader("test_file.csv")
     with pytest.raises(TypeError):
         dr.validate_csv_data(time_array, voltage_array)
 
@@ -130,7 +139,8 @@ def test_validate_csv_data_check_nan(time_array, voltage_array):
     (np.array([1, 2, 3]), np.array([1, 2])),
     (np.array([1, 2]), np.array([1, 2, 3])),
 ])
-def test_validate_csv_data_compare_array_lengths(time_array, voltage_array):
+def test_validate_csv_data_compare_array_lengths(dr, time_array,
+                                                 voltage_array):
     """Checks that validate_csv_data raises a ValueError when the time and
     voltage arrays are of different lengths.
 
@@ -145,7 +155,6 @@ def test_validate_csv_data_compare_array_lengths(time_array, voltage_array):
     -------
     None
     """
-    dr = DataReader("test_file.csv")
     with pytest.raises(ValueError):
         dr.validate_csv_data(time_array, voltage_array)
 
@@ -171,15 +180,20 @@ def test_validate_csv_data_compare_array_lengths2():
                     "the time and voltage arrays are of the same length.")
 
 
+def _zeros_then_nans(num_zeros, num_nans):
+    """Builds a float array of num_zeros zeros followed by num_nans NaNs
+    in a single allocation, for the can_interp test cases below."""
+    test_array = np.empty(num_zeros + num_nans)
+    test_array[:num_zeros] = 0
+    test_array[num_zeros:] = np.nan
+    return test_array
+
+
 @pytest.mark.parametrize("test_array, expected_can_interp", [
-    (np.append(np.zeros(100), np.full_like(np.zeros(1), np.nan,
-                                           dtype=np.double)), True),
-    (np.append(np.zeros(10), np.full_like(np.zeros(10), np.nan,
-                                          dtype=np.double)), False),
-    (np.append(np.zeros(9), np.full_like(np.zeros(1), np.nan,
-                                         dtype=np.double)), True),
-    (np.append(np.zeros(8), np.full_like(np.zeros(1), np.nan,
-                                         dtype=np.double)), False),
+    (_zeros_then_nans(100, 1), True),
+    (_zeros_then_nans(10, 10), False),
+    (_zeros_then_nans(9, 1), True),
+    (_zeros_then_nans(8, 1), False),
 ])
 def test_can_interp(dr, test_array, expected_can_interp):
     """Tests the can_interp function to determine if it returns true for
@@ -214,7 +228,7 @@ def test_interp_time(dr):
     None
     """
     time_array = np.array([1, 2, np.nan, 4, 5, np.nan, 7])
-    expected_interp_array = np.array([1, 2, 3, 4, 5, 6, 7])
+    expected_interp_array = np.arange(1, 8, dtype=np.float64)
     measured_interp_array = dr.interp_time(time_array)
 
     assert np.array_equal(measured_interp_array, expected_interp_array)
@@ -224,7 +238,7 @@ def test_interp_time(dr):
     ("voltage", np.array([10, 15, 20])),
     ("time", np.array([0, 1, 2])),
 ])
-def test_output_dict(dict_entry, expected_value):
+def test_output_dict(dr, dict_entry, expected_value):
     """Tests that the time and voltage values in the output_dict are what
     was expected, based on the csv file that the DataReader read in.
 
@@ -241,8 +255,7 @@ def test_output_dict(dict_entry, expected_value):
     -------
 
     """
-    dr = DataReader("test_file.csv")
-    assert (dr.output_dict[dict_entry].all() == expected_value.all())
+    assert np.array_equal(dr.output_dict[dict_entry], expected_value)
 
 
 @pytest.mark.parametrize("input_duration, expected_duration", [
@@ -1,27 +1,43 @@
 import json
 import numpy as np
 import os
+import shutil
 from DataReader import DataReader
 from HRM_Processor import HRM_Processor
 from DataWriter import DataWriter
 import pytest
 
 
-def test_DataWriter_init_valid_case():
+def test_DataWriter_init_valid_case(tmp_path):
     """Tests the initialization of the DataWriter object, and that it
-    successfully gets the output_dict from the input_dict and stores it as
-    metrics.
+    copies the relevant metrics from the HRM_Processor's output_dict into
+    its metrics dictionary without aliasing the processor's dictionary.
+
+    The CSV file is copied into tmp_path first, so the JSON file the
+    DataWriter constructor writes lands in the per-test temporary
+    directory instead of the project directory.
+
+    Parameters
+    ----------
+    tmp_path:   Pytest fixture
+                A per-test temporary directory for the CSV and JSON files
 
     Returns
     -------
     None
 
     """
+    csv_copy = tmp_path / "test_data1.csv"
+    shutil.copyfile("test_data1.csv", csv_copy)
 
-    dr = DataReader("test_data1.csv")
+    dr = DataReader(str(csv_copy))
     hrm = HRM_Processor(dr)
     dw = DataWriter(hrm)
-    assert dw.metrics == hrm.output_dict
+
+    assert dw.metrics is not hrm.output_dict
+    for key in ("mean_hr_bpm", "voltage_extremes", "duration", "num_beats"):
+        assert dw.metrics[key] == hrm.output_dict[key]
+    assert dw.metrics["beats"] == hrm.output_dict["beats"].tolist()
 
 
 def test_DataWriter_init_invalid_case(hrm):
@@ -40,43 +56,61 @@ def test_DataWriter_init_invalid_case(hrm):
 
     """
     hrm.isValid = False  # Force invalidity for testing case
-    with pytest.raises(ValueError):
-        dw = DataWriter(hrm)
+    try:
+        with pytest.raises(ValueError):
+            dw = DataWriter(hrm)
+    finally:
+        hrm.isValid = True  # Restore the session-scoped fixture
 
 
-def test_DataWriter_init_write_to_dict():
+def test_DataWriter_init_write_to_dict(tmp_path):
     """Tests that the construction of a DataWriter object creates a .json
     file with the base file name that is the same as the file name of the
     .csv file passed into the original DataReader.
 
+    The CSV file is copied into tmp_path first, so the JSON output lands
+    in the per-test temporary directory instead of the project directory
+    and no manual cleanup is needed.
+
+    Parameters
+    ----------
+    tmp_path:   Pytest fixture
+                A per-test temporary directory for the CSV and JSON files
+
     Returns
     -------
     None
     """
-    dr = DataReader("test_data1.csv")
+    csv_copy = tmp_path / "test_data1.csv"
+    shutil.copyfile("test_data1.csv", csv_copy)
+
+    dr = DataReader(str(csv_copy))
     hrm = HRM_Processor(dr)
     dw = DataWriter(hrm)
 
-    assert os.path.isfile("test_data1.json")
-    os.remove("test_data1.json")
+    assert os.path.isfile(tmp_path / "test_data1.json")
 
 
-def test_write_to_json():
+def test_write_to_json(dw, tmp_path):
     """Tests the write_to_json function of the DataWriter, which should be
     able to take in an dictionary and output file path, and write that
     dictionary to the specified output file.
 
+    Parameters
+    ----------
+    dw:         DataWriter
+                A generic DataWriter object made from an original
+                DataReader / HRM_Processor with the file test_data1.csv.
+    tmp_path:   Pytest fixture
+                A per-test temporary directory for the output file
+
     Returns
     -------
     None
     """
-    dr = DataReader("test_data1.csv")
-    hrm = HRM_Processor(dr)
-    dw = DataWriter(hrm)
-
     metrics = {"test": 5,
                "another word": 18.5}
-    output_file = "test.json"
+    output_file = str(tmp_path / "test.json")
     dw.write_to_json(metrics, output_file)
 
     with open(output_file) as infile:
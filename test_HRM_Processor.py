@@ -1,5 +1,4 @@
 import pytest
-from DataReader import DataReader
 from HRM_Processor import HRM_Processor
 import numpy as np
 